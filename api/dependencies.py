@@ -1,39 +1,67 @@
+import hmac
+import time
 from typing import AsyncGenerator
 
-from fastapi import HTTPException, Security, status
-from fastapi.security.api_key import APIKeyHeader
+from fastapi import status
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from db.sessions import async_session
 from settings import settings
 
-api_key_header = APIKeyHeader(name=settings.API_KEY_NAME, auto_error=False)
+API_KEY_CACHE_TTL = 30
+API_KEY_CACHE_MAX_SIZE = 1024
 
+_valid_keys: dict[bytes, float] = {}
 
-async def validate_api_key(api_key: str = Security(api_key_header)) -> str:
-    """Validate API key from request header
 
-    Args:
-        api_key: API key from request header
+class APIKeyMiddleware:
+    """Validate the API key header before the request enters the app
 
-    Returns:
-        API key if valid
-
-    Raises:
-        HTTPException: If API key is invalid or missing
+    Unauthorized requests are rejected with a 403 response without paying
+    for FastAPI's routing, dependency resolution or query parsing.
 
     """
-    if not api_key:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="API key is missing"
-        )
 
-    if api_key != settings.API_KEY:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="Invalid API key"
-        )
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._header_name = settings.API_KEY_NAME.lower().encode()
+        self._api_key = settings.API_KEY.encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        api_key = None
+        for name, value in scope["headers"]:
+            if name == self._header_name:
+                api_key = value
+                break
+
+        if not api_key:
+            response = JSONResponse(
+                content={"detail": "API key is missing"},
+                status_code=status.HTTP_403_FORBIDDEN,
+            )
+            await response(scope, receive, send)
+            return
+
+        if time.monotonic() >= _valid_keys.get(api_key, 0.0):
+            if not hmac.compare_digest(api_key, self._api_key):
+                response = JSONResponse(
+                    content={"detail": "Invalid API key"},
+                    status_code=status.HTTP_403_FORBIDDEN,
+                )
+                await response(scope, receive, send)
+                return
+
+            if len(_valid_keys) > API_KEY_CACHE_MAX_SIZE:
+                _valid_keys.clear()
+            _valid_keys[api_key] = time.monotonic() + API_KEY_CACHE_TTL
 
-    return api_key
+        await self.app(scope, receive, send)
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -1,26 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.dependencies import get_db_session, validate_api_key
+from api.dependencies import get_db_session
 from api.schemas import (
     Organization,
     OrganizationByActivityQuery,
     OrganizationByBuildingQuery,
     OrganizationByNameQuery,
+    OrganizationByNearestQuery,
     OrganizationByRadiusQuery,
     OrganizationByRectangleQuery,
     OrganizationDetail,
 )
-from db.queries import (
-    get_organization_detail,
-    get_organizations_by_activity_id,
-    get_organizations_by_building_id,
-    get_organizations_by_name,
-    get_organizations_by_radius,
-    get_organizations_by_rectangle,
-)
+from db import queries
+
+router = APIRouter(prefix="/organizations", default_response_class=ORJSONResponse)
+
+_ORG_LIST = TypeAdapter(list[Organization])
+
+
+def _organization_list_response(organizations) -> Response:
+    """Serialize organization rows to a JSON response in one pass
 
-router = APIRouter(prefix="/organizations", dependencies=[Depends(validate_api_key)])
+    Args:
+        organizations: Organization rows from a list query
+
+    Returns:
+        JSON response with the validated organization list
+
+    """
+    return Response(
+        content=_ORG_LIST.dump_json(
+            _ORG_LIST.validate_python(organizations, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -31,9 +49,8 @@ async def get_organizations_by_name(
     params: OrganizationByNameQuery = Query(),
     session: AsyncSession = Depends(get_db_session),
 ) -> list[Organization]:
-    return map(
-        Organization.model_validate,
-        await get_organizations_by_name(session=session, **params.model_dump()),
+    return _organization_list_response(
+        await queries.get_organizations_by_name(session=session, **params.model_dump())
     )
 
 
@@ -45,9 +62,10 @@ async def get_organizations_by_building(
     params: OrganizationByBuildingQuery = Query(),
     session: AsyncSession = Depends(get_db_session),
 ) -> list[Organization]:
-    return map(
-        Organization.model_validate,
-        await get_organizations_by_building_id(session=session, **params.model_dump()),
+    return _organization_list_response(
+        await queries.get_organizations_by_building_id(
+            session=session, **params.model_dump()
+        )
     )
 
 
@@ -59,9 +77,10 @@ async def get_organizations_by_activity(
     params: OrganizationByActivityQuery = Query(),
     session: AsyncSession = Depends(get_db_session),
 ) -> list[Organization]:
-    return map(
-        Organization.model_validate,
-        await get_organizations_by_activity_id(session=session, **params.model_dump()),
+    return _organization_list_response(
+        await queries.get_organizations_by_activity_id(
+            session=session, **params.model_dump()
+        )
     )
 
 
@@ -73,9 +92,23 @@ async def search_organizations_by_radius(
     params: OrganizationByRadiusQuery = Query(),
     session: AsyncSession = Depends(get_db_session),
 ) -> list[Organization]:
-    return map(
-        Organization.model_validate,
-        await get_organizations_by_radius(session=session, **params.model_dump()),
+    return _organization_list_response(
+        await queries.get_organizations_by_radius(
+            session=session, **params.model_dump()
+        )
+    )
+
+
+@router.post(
+    path="/search/nearest",
+    description="Search organizations nearest to a center point",
+)
+async def search_nearest_organizations(
+    params: OrganizationByNearestQuery = Query(),
+    session: AsyncSession = Depends(get_db_session),
+) -> list[Organization]:
+    return _organization_list_response(
+        await queries.get_nearest_organizations(session=session, **params.model_dump())
     )
 
 
@@ -87,9 +120,10 @@ async def search_organizations_by_rectangle(
     params: OrganizationByRectangleQuery = Query(),
     session: AsyncSession = Depends(get_db_session),
 ) -> list[Organization]:
-    return map(
-        Organization.model_validate,
-        await get_organizations_by_rectangle(session=session, **params.model_dump()),
+    return _organization_list_response(
+        await queries.get_organizations_by_rectangle(
+            session=session, **params.model_dump()
+        )
     )
 
 
@@ -98,9 +132,11 @@ async def search_organizations_by_rectangle(
     description="Get detailed information about a specific organization",
 )
 async def get_organization(
-    organization_id: int, session: AsyncSession = Depends(get_db_session)
+    organization_id: int,
+    request: Request,
+    session: AsyncSession = Depends(get_db_session),
 ) -> OrganizationDetail:
-    organization = await get_organization_detail(
+    organization = await queries.get_organization_detail(
         session=session, organization_id=organization_id
     )
     if not organization:
@@ -108,11 +144,15 @@ async def get_organization(
             status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found"
         )
 
-    return OrganizationDetail(
-        id=organization.id,
-        name=organization.name,
-        building_id=organization.building_id,
-        building=organization.building,
-        phone_numbers=organization.phone_numbers,
-        activities=[activity.activity for activity in organization.activities],
+    etag = hashlib.blake2b(
+        f"{organization.id}:{organization.updated_at.timestamp()}".encode(),
+        digest_size=8,
+    ).hexdigest()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    return Response(
+        content=OrganizationDetail.model_validate(organization).model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag},
     )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class BaseSchema(BaseModel):
@@ -50,7 +50,7 @@ class PhoneNumber(BaseSchema):
         default=..., description="ID of the organization", ge=0
     )
     number: str = Field(
-        default=..., description="Phone number", min_length=1, max_length=255
+        default=..., description="Phone number", min_length=1, max_length=20
     )
 
 
@@ -76,7 +76,9 @@ class OrganizationDetail(Organization):
         default_factory=list, description="Phone numbers of the organization"
     )
     activities: list[Activity] = Field(
-        default_factory=list, description="Activities of the organization"
+        default_factory=list,
+        validation_alias="activity_objs",
+        description="Activities of the organization",
     )
 
 
@@ -111,6 +113,16 @@ class OrganizationByRadiusQuery(PaginationQuery):
     radius: float = Field(default=..., description="Search radius in kilometers", gt=0)
 
 
+class OrganizationByNearestQuery(BaseModel):
+    center_latitude: float = Field(default=..., description="Latitude", ge=-90, le=90)
+    center_longitude: float = Field(
+        default=..., description="Longitude", ge=-180, le=180
+    )
+    limit: int = Field(
+        default=10, description="Number of nearest organizations", gt=0, le=100
+    )
+
+
 class OrganizationByRectangleQuery(PaginationQuery):
     min_latitude: float = Field(
         default=..., description="Minimum latitude", ge=-90, le=90
@@ -124,3 +136,9 @@ class OrganizationByRectangleQuery(PaginationQuery):
     max_longitude: float = Field(
         default=..., description="Maximum longitude", ge=-180, le=180
     )
+
+
+# Build the pydantic-core validators for the response models at import time
+# so the first request does not pay the schema-compilation cost.
+for _model in (Activity, Building, PhoneNumber, Organization, OrganizationDetail):
+    TypeAdapter(_model)
@@ -0,0 +1,27 @@
+"""Add index on activities.parent_id
+
+Revision ID: 0ffc770df087
+Revises: e42bfee955cf
+Create Date: 2025-05-19 13:05:33.441209
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0ffc770df087"
+down_revision: Union[str, None] = "e42bfee955cf"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_activities_parent_id"), "activities", ["parent_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_activities_parent_id"), table_name="activities")
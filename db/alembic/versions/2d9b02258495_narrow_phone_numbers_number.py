@@ -0,0 +1,38 @@
+"""Narrow phone_numbers.number to String(20)
+
+Revision ID: 2d9b02258495
+Revises: 0ffc770df087
+Create Date: 2025-05-19 13:42:18.906741
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2d9b02258495"
+down_revision: Union[str, None] = "0ffc770df087"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "phone_numbers",
+        "number",
+        existing_type=sa.String(length=255),
+        type_=sa.String(length=20),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "phone_numbers",
+        "number",
+        existing_type=sa.String(length=20),
+        type_=sa.String(length=255),
+        existing_nullable=False,
+    )
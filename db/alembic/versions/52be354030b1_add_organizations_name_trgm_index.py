@@ -0,0 +1,33 @@
+"""Add trigram GIN index on organizations.name
+
+Revision ID: 52be354030b1
+Revises: 67c7f93330de
+Create Date: 2025-05-19 11:48:29.633417
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "52be354030b1"
+down_revision: Union[str, None] = "67c7f93330de"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        op.f("ix_organizations_name_trgm"),
+        "organizations",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_organizations_name_trgm"), table_name="organizations")
@@ -0,0 +1,33 @@
+"""Add covering index on organization_activities (activity_id, organization_id)
+
+Revision ID: 67c7f93330de
+Revises: ccef67ffb5ab
+Create Date: 2025-05-19 11:02:51.874306
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "67c7f93330de"
+down_revision: Union[str, None] = "ccef67ffb5ab"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_organization_activities_activity_id_organization_id"),
+        "organization_activities",
+        ["activity_id", "organization_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_organization_activities_activity_id_organization_id"),
+        table_name="organization_activities",
+    )
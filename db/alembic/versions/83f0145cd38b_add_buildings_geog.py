@@ -0,0 +1,47 @@
+"""Add buildings.geog geography column with GiST index
+
+Revision ID: 83f0145cd38b
+Revises: 485e978a57db
+Create Date: 2025-05-19 10:12:44.102938
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from geoalchemy2 import Geography
+
+# revision identifiers, used by Alembic.
+revision: str = "83f0145cd38b"
+down_revision: Union[str, None] = "485e978a57db"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS postgis")
+    op.add_column(
+        "buildings",
+        sa.Column(
+            "geog",
+            Geography(geometry_type="POINT", srid=4326, spatial_index=False),
+            sa.Computed(
+                "(ST_SetSRID(ST_MakePoint(longitude, latitude), 4326))::geography",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        op.f("ix_buildings_geog"),
+        "buildings",
+        ["geog"],
+        unique=False,
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_buildings_geog"), table_name="buildings")
+    op.drop_column("buildings", "geog")
@@ -0,0 +1,30 @@
+"""Add composite index on buildings (latitude, longitude)
+
+Revision ID: ccef67ffb5ab
+Revises: 83f0145cd38b
+Create Date: 2025-05-19 10:31:07.518264
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ccef67ffb5ab"
+down_revision: Union[str, None] = "83f0145cd38b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_buildings_latitude_longitude"),
+        "buildings",
+        ["latitude", "longitude"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_buildings_latitude_longitude"), table_name="buildings")
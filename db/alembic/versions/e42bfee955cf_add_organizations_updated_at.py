@@ -0,0 +1,34 @@
+"""Add organizations.updated_at
+
+Revision ID: e42bfee955cf
+Revises: 52be354030b1
+Create Date: 2025-05-19 12:20:15.297483
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e42bfee955cf"
+down_revision: Union[str, None] = "52be354030b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "organizations",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("organizations", "updated_at")
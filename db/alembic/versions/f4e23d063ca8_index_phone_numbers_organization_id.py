@@ -0,0 +1,30 @@
+"""Index phone_numbers.organization_id
+
+Revision ID: f4e23d063ca8
+Revises: 2d9b02258495
+Create Date: 2025-05-19 14:05:52.331287
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f4e23d063ca8"
+down_revision: Union[str, None] = "2d9b02258495"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_phone_numbers_organization_id"),
+        "phone_numbers",
+        ["organization_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_phone_numbers_organization_id"), table_name="phone_numbers")
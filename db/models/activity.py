@@ -13,7 +13,7 @@ class Activity(Base):
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, unique=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     parent_id: Mapped[int | None] = mapped_column(
-        ForeignKey("activities.id"), nullable=True
+        ForeignKey("activities.id"), index=True, nullable=True
     )
     level: Mapped[int] = mapped_column(nullable=False, default=1)
 
@@ -1,4 +1,5 @@
-from sqlalchemy import CheckConstraint, String
+from geoalchemy2 import Geography, WKBElement
+from sqlalchemy import CheckConstraint, Computed, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.models.base import Base
@@ -13,11 +14,21 @@ class Building(Base):
         CheckConstraint(
             "longitude >= -180 AND longitude <= 180", name="check_longitude_range"
         ),
+        Index("ix_buildings_geog", "geog", postgresql_using="gist"),
+        Index("ix_buildings_latitude_longitude", "latitude", "longitude"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, unique=True)
     address: Mapped[str] = mapped_column(String(255), nullable=False)
     latitude: Mapped[float] = mapped_column(nullable=False)
     longitude: Mapped[float] = mapped_column(nullable=False)
+    geog: Mapped[WKBElement | None] = mapped_column(
+        Geography(geometry_type="POINT", srid=4326, spatial_index=False),
+        Computed(
+            "(ST_SetSRID(ST_MakePoint(longitude, latitude), 4326))::geography",
+            persisted=True,
+        ),
+        nullable=True,
+    )
 
     organizations = relationship("Organization", back_populates="building")
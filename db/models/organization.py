@@ -1,4 +1,7 @@
-from sqlalchemy import ForeignKey, String
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Index, String, func
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.models.base import Base
@@ -6,10 +9,21 @@ from db.models.base import Base
 
 class Organization(Base):
     __tablename__ = "organizations"
+    __table_args__ = (
+        Index(
+            "ix_organizations_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, unique=True)
     name: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
     building_id: Mapped[int] = mapped_column(ForeignKey("buildings.id"), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(), onupdate=func.now(), nullable=False
+    )
 
     building = relationship("Building", back_populates="organizations")
     phone_numbers = relationship(
@@ -20,3 +34,4 @@ class Organization(Base):
         back_populates="organization",
         cascade="all, delete-orphan",
     )
+    activity_objs = association_proxy("activities", "activity")
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.models.base import Base
@@ -6,6 +6,13 @@ from db.models.base import Base
 
 class OrganizationActivity(Base):
     __tablename__ = "organization_activities"
+    __table_args__ = (
+        Index(
+            "ix_organization_activities_activity_id_organization_id",
+            "activity_id",
+            "organization_id",
+        ),
+    )
 
     organization_id: Mapped[int] = mapped_column(
         ForeignKey("organizations.id"), primary_key=True
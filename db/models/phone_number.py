@@ -8,9 +8,9 @@ class PhoneNumber(Base):
     __tablename__ = "phone_numbers"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, unique=True)
-    number: Mapped[str] = mapped_column(String(255), nullable=False)
+    number: Mapped[str] = mapped_column(String(20), nullable=False)
     organization_id: Mapped[int] = mapped_column(
-        ForeignKey("organizations.id"), nullable=False
+        ForeignKey("organizations.id"), nullable=False, index=True
     )
 
     organization = relationship("Organization", back_populates="phone_numbers")
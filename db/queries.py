@@ -1,9 +1,21 @@
-from geopy.distance import geodesic
-from sqlalchemy import select
+import asyncio
+
+from geoalchemy2 import Geography
+from sqlalchemy import RowMapping, cast, exists, func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from db import models
+from db.sessions import async_session
+
+ORGANIZATION_COLUMNS = (
+    models.Organization.id,
+    models.Organization.name,
+    models.Organization.building_id,
+)
+
+_activity_descendants: dict[int, frozenset[int]] | None = None
+_activity_cache_lock = asyncio.Lock()
 
 
 async def get_organizations_by_name(
@@ -11,24 +23,77 @@ async def get_organizations_by_name(
     limit: int,
     name: str | None,
     session: AsyncSession,
-) -> list[models.Organization]:
-    query = select(models.Organization)
-    if name:
-        query = query.where(models.Organization.name.ilike(f"%{name}%"))
-    result = await session.execute(query.offset(skip).limit(limit))
-    return result.scalars().all()
+) -> list[RowMapping]:
+    pattern = f"%{name}%" if name else None
+    query = lambda_stmt(lambda: select(*ORGANIZATION_COLUMNS))
+    if pattern:
+        query += lambda s: s.where(models.Organization.name.ilike(pattern))
+    query += lambda s: s.offset(skip).limit(limit)
+    result = await session.execute(query)
+    return result.mappings().all()
 
 
 async def get_organizations_by_building_id(
     skip: int, limit: int, building_id: int, session: AsyncSession
-) -> list[models.Organization]:
+) -> list[RowMapping]:
     result = await session.execute(
-        select(models.Organization)
-        .where(models.Organization.building_id == building_id)
-        .offset(skip)
-        .limit(limit)
+        lambda_stmt(
+            lambda: select(*ORGANIZATION_COLUMNS)
+            .where(models.Organization.building_id == building_id)
+            .offset(skip)
+            .limit(limit)
+        )
     )
-    return result.scalars().all()
+    return result.mappings().all()
+
+
+async def refresh_activity_cache() -> None:
+    """Rebuild the in-process map of activity descendant sets
+
+    The activity tree is small and rarely changes, so it is materialized
+    once from a single table scan. Called at application startup and to be
+    called again after any Activity mutation.
+
+    """
+    global _activity_descendants
+
+    async with _activity_cache_lock:
+        async with async_session() as session:
+            result = await session.execute(
+                select(models.Activity.id, models.Activity.parent_id)
+            )
+            rows = result.all()
+
+        children: dict[int | None, list[int]] = {}
+        for activity_id, parent_id in rows:
+            children.setdefault(parent_id, []).append(activity_id)
+
+        descendants: dict[int, frozenset[int]] = {}
+        for activity_id, _ in rows:
+            ids = [activity_id]
+            queue = [activity_id]
+            while queue:
+                for child_id in children.get(queue.pop(), ()):
+                    ids.append(child_id)
+                    queue.append(child_id)
+            descendants[activity_id] = frozenset(ids)
+
+        _activity_descendants = descendants
+
+
+async def _get_descendant_activity_ids(activity_id: int) -> frozenset[int]:
+    """Resolve an activity and all of its descendants from the cache
+
+    Args:
+        activity_id: Root activity ID
+
+    Returns:
+        IDs of the activity and every activity below it
+
+    """
+    if _activity_descendants is None:
+        await refresh_activity_cache()
+    return _activity_descendants.get(activity_id, frozenset((activity_id,)))
 
 
 async def get_organizations_by_activity_id(
@@ -37,48 +102,21 @@ async def get_organizations_by_activity_id(
     activity_id: int,
     include_children: bool,
     session: AsyncSession,
-) -> list[models.Organization]:
-    query = select(models.Organization).join(
-        models.OrganizationActivity,
-        models.Organization.id == models.OrganizationActivity.organization_id,
-    )
-
+) -> list[RowMapping]:
     if include_children:
-        activity_ids = [activity_id]
-        activity_result = await session.execute(
-            select(models.Activity).where(models.Activity.id == activity_id)
-        )
-        activity = activity_result.scalar_one_or_none()
-
-        if not activity:
-            return None
-        if activity.level < 3:
-            children_result = await session.execute(
-                select(models.Activity).where(models.Activity.parent_id == activity_id)
-            )
-            children = children_result.scalars().all()
-            activity_ids.extend([child.id for child in children])
-            if activity.level == 1:
-                for child in children:
-                    grandchildren_result = await session.execute(
-                        select(models.Activity).where(
-                            models.Activity.parent_id == child.id
-                        )
-                    )
-                    activity_ids.extend(
-                        [
-                            grandchild.id
-                            for grandchild in grandchildren_result.scalars().all()
-                        ]
-                    )
-        query = query.where(
-            models.OrganizationActivity.activity_id.in_(activity_ids)
-        ).distinct()
+        activity_ids = await _get_descendant_activity_ids(activity_id)
+        activity_filter = models.OrganizationActivity.activity_id.in_(activity_ids)
     else:
-        query = query.where(models.OrganizationActivity.activity_id == activity_id)
+        activity_filter = models.OrganizationActivity.activity_id == activity_id
+
+    query = select(*ORGANIZATION_COLUMNS).where(
+        exists()
+        .where(models.OrganizationActivity.organization_id == models.Organization.id)
+        .where(activity_filter)
+    )
 
     result = await session.execute(query.offset(skip).limit(limit))
-    return result.scalars().all()
+    return result.mappings().all()
 
 
 async def get_organizations_by_radius(
@@ -88,25 +126,61 @@ async def get_organizations_by_radius(
     center_longitude: float,
     radius: float,
     session: AsyncSession,
-) -> list[models.Organization]:
-    buildings_result = await session.execute(select(models.Building))
-    building_ids = []
-    for building in buildings_result.scalars().all():
-        distance = geodesic(
-            (center_latitude, center_longitude),
-            (building.latitude, building.longitude),
-        ).kilometers
-        if distance <= radius:
-            building_ids.append(building.id)
-    if not building_ids:
-        return []
+) -> list[RowMapping]:
+    radius_meters = radius * 1000
+    result = await session.execute(
+        lambda_stmt(
+            lambda: select(*ORGANIZATION_COLUMNS)
+            .join(
+                models.Building,
+                models.Organization.building_id == models.Building.id,
+            )
+            .where(
+                func.ST_DWithin(
+                    models.Building.geog,
+                    cast(
+                        func.ST_SetSRID(
+                            func.ST_MakePoint(center_longitude, center_latitude), 4326
+                        ),
+                        Geography(geometry_type="POINT", srid=4326),
+                    ),
+                    radius_meters,
+                )
+            )
+            .offset(skip)
+            .limit(limit)
+        )
+    )
+    return result.mappings().all()
+
+
+async def get_nearest_organizations(
+    limit: int,
+    center_latitude: float,
+    center_longitude: float,
+    session: AsyncSession,
+) -> list[RowMapping]:
     result = await session.execute(
-        select(models.Organization)
-        .where(models.Organization.building_id.in_(building_ids))
-        .offset(skip)
-        .limit(limit)
+        lambda_stmt(
+            lambda: select(*ORGANIZATION_COLUMNS)
+            .join(
+                models.Building,
+                models.Organization.building_id == models.Building.id,
+            )
+            .order_by(
+                models.Building.geog.distance_centroid(
+                    cast(
+                        func.ST_SetSRID(
+                            func.ST_MakePoint(center_longitude, center_latitude), 4326
+                        ),
+                        Geography(geometry_type="POINT", srid=4326),
+                    )
+                )
+            )
+            .limit(limit)
+        )
     )
-    return result.scalars().all()
+    return result.mappings().all()
 
 
 async def get_organizations_by_rectangle(
@@ -117,33 +191,31 @@ async def get_organizations_by_rectangle(
     min_longitude: float,
     max_longitude: float,
     session: AsyncSession,
-) -> list[models.Organization]:
-    buildings_result = await session.execute(
-        select(models.Building.id).where(
-            (models.Building.latitude >= min_latitude)
-            & (models.Building.latitude <= max_latitude)
-            & (models.Building.longitude >= min_longitude)
-            & (models.Building.longitude <= max_longitude)
-        )
-    )
-    building_ids = buildings_result.scalars().all()
-    if not building_ids:
-        return []
+) -> list[RowMapping]:
     result = await session.execute(
-        select(models.Organization)
-        .where(models.Organization.building_id.in_(building_ids))
-        .offset(skip)
-        .limit(limit)
+        lambda_stmt(
+            lambda: select(*ORGANIZATION_COLUMNS)
+            .join(
+                models.Building,
+                models.Organization.building_id == models.Building.id,
+            )
+            .where(
+                models.Building.latitude.between(min_latitude, max_latitude),
+                models.Building.longitude.between(min_longitude, max_longitude),
+            )
+            .offset(skip)
+            .limit(limit)
+        )
     )
-    return result.scalars().all()
+    return result.mappings().all()
 
 
 async def get_organization_detail(
     organization_id: int, session: AsyncSession
 ) -> models.Organization | None:
     result = await session.execute(
-        (
-            select(models.Organization)
+        lambda_stmt(
+            lambda: select(models.Organization)
             .options(
                 selectinload(models.Organization.building),
                 selectinload(models.Organization.phone_numbers),
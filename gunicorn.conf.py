@@ -1,5 +1,5 @@
 bind = "0.0.0.0:8000"
-worker_class = "uvicorn.workers.UvicornWorker"
+worker_class = "worker.UvicornWorker"
 worker_connections = 500
 max_requests = 2000
 max_requests_jitter = 400
@@ -1,5 +1,9 @@
 import asyncio
 import logging
+from typing import Awaitable, Callable, TypeVar
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.models import (
     Activity,
@@ -10,169 +14,193 @@ from db.models import (
 )
 from db.sessions import async_session
 
+T = TypeVar("T")
+
 
-async def create_activities() -> dict[str, Activity]:
+async def create_activities(session: AsyncSession) -> dict[str, int]:
     """Create sample activities hierarchy
 
+    Args:
+        session: SQLAlchemy async session
+
     Returns:
-        Dictionary of activities
+        Dictionary of activity IDs
 
     """
-    async with async_session() as session:
-        food = Activity(name="Food", level=1)
-        cars = Activity(name="Cars", level=1)
-        session.add_all([food, cars])
-        await session.commit()
-
-        meat = Activity(name="Meat products", parent_id=food.id, level=2)
-        dairy = Activity(name="Dairy products", parent_id=food.id, level=2)
-        trucks = Activity(name="Trucks", parent_id=cars.id, level=2)
-        passenger_cars = Activity(name="Passenger cars", parent_id=cars.id, level=2)
-        session.add_all([meat, dairy, trucks, passenger_cars])
-        await session.commit()
-
-        parts = Activity(name="Parts", parent_id=passenger_cars.id, level=3)
-        accessories = Activity(name="Accessories", parent_id=passenger_cars.id, level=3)
-        session.add_all([parts, accessories])
-        await session.commit()
+    result = await session.execute(
+        insert(Activity).returning(Activity.id, sort_by_parameter_order=True),
+        [
+            {"name": "Food", "level": 1},
+            {"name": "Cars", "level": 1},
+        ],
+    )
+    food_id, cars_id = result.scalars().all()
+
+    result = await session.execute(
+        insert(Activity).returning(Activity.id, sort_by_parameter_order=True),
+        [
+            {"name": "Meat products", "parent_id": food_id, "level": 2},
+            {"name": "Dairy products", "parent_id": food_id, "level": 2},
+            {"name": "Trucks", "parent_id": cars_id, "level": 2},
+            {"name": "Passenger cars", "parent_id": cars_id, "level": 2},
+        ],
+    )
+    meat_id, dairy_id, trucks_id, passenger_cars_id = result.scalars().all()
+
+    result = await session.execute(
+        insert(Activity).returning(Activity.id, sort_by_parameter_order=True),
+        [
+            {"name": "Parts", "parent_id": passenger_cars_id, "level": 3},
+            {"name": "Accessories", "parent_id": passenger_cars_id, "level": 3},
+        ],
+    )
+    parts_id, accessories_id = result.scalars().all()
 
-        return {
-            "food": food,
-            "meat": meat,
-            "dairy": dairy,
-            "cars": cars,
-            "trucks": trucks,
-            "passenger_cars": passenger_cars,
-            "parts": parts,
-            "accessories": accessories,
-        }
+    return {
+        "food": food_id,
+        "meat": meat_id,
+        "dairy": dairy_id,
+        "cars": cars_id,
+        "trucks": trucks_id,
+        "passenger_cars": passenger_cars_id,
+        "parts": parts_id,
+        "accessories": accessories_id,
+    }
 
 
-async def create_buildings() -> list[Building]:
+async def create_buildings(session: AsyncSession) -> list[int]:
     """Create sample buildings
 
+    Args:
+        session: SQLAlchemy async session
+
     Returns:
-        List of buildings
+        List of building IDs
 
     """
-    async with async_session() as session:
-        buildings = [
-            Building(
-                address="123 Main St, New York", latitude=40.7128, longitude=-74.0060
-            ),
-            Building(
-                address="456 Market St, San Francisco",
-                latitude=37.7749,
-                longitude=-122.4194,
-            ),
-            Building(
-                address="789 Lombard St, San Francisco",
-                latitude=37.8025,
-                longitude=-122.4186,
-            ),
-            Building(
-                address="321 Pine St, Seattle", latitude=47.6062, longitude=-122.3321
-            ),
-            Building(
-                address="654 Broadway, New York", latitude=40.7308, longitude=-73.9973
-            ),
-        ]
-        session.add_all(buildings)
-        await session.commit()
-
-        return buildings
+    result = await session.execute(
+        insert(Building).returning(Building.id, sort_by_parameter_order=True),
+        [
+            {
+                "address": "123 Main St, New York",
+                "latitude": 40.7128,
+                "longitude": -74.0060,
+            },
+            {
+                "address": "456 Market St, San Francisco",
+                "latitude": 37.7749,
+                "longitude": -122.4194,
+            },
+            {
+                "address": "789 Lombard St, San Francisco",
+                "latitude": 37.8025,
+                "longitude": -122.4186,
+            },
+            {
+                "address": "321 Pine St, Seattle",
+                "latitude": 47.6062,
+                "longitude": -122.3321,
+            },
+            {
+                "address": "654 Broadway, New York",
+                "latitude": 40.7308,
+                "longitude": -73.9973,
+            },
+        ],
+    )
+    return result.scalars().all()
 
 
 async def create_organizations(
-    buildings: list[Building], activities: dict[str, Activity]
+    session: AsyncSession, building_ids: list[int], activities: dict[str, int]
 ) -> None:
     """Create sample organizations with phone numbers and activities
 
     Args:
-        buildings: List of buildings
-        activities: Dictionary of activities
+        session: SQLAlchemy async session
+        building_ids: List of building IDs
+        activities: Dictionary of activity IDs
 
     """
-    async with async_session() as session:
-        org1 = Organization(name="Best Foods Inc.", building_id=buildings[0].id)
-        org2 = Organization(name="Dairy King", building_id=buildings[1].id)
-        org3 = Organization(name="Meat Masters", building_id=buildings[0].id)
-        org4 = Organization(name="Auto World", building_id=buildings[2].id)
-        org5 = Organization(name="Truck Paradise", building_id=buildings[3].id)
-        org6 = Organization(name="Car Parts Emporium", building_id=buildings[4].id)
-
-        session.add_all([org1, org2, org3, org4, org5, org6])
-        await session.commit()
+    result = await session.execute(
+        insert(Organization).returning(Organization.id, sort_by_parameter_order=True),
+        [
+            {"name": "Best Foods Inc.", "building_id": building_ids[0]},
+            {"name": "Dairy King", "building_id": building_ids[1]},
+            {"name": "Meat Masters", "building_id": building_ids[0]},
+            {"name": "Auto World", "building_id": building_ids[2]},
+            {"name": "Truck Paradise", "building_id": building_ids[3]},
+            {"name": "Car Parts Emporium", "building_id": building_ids[4]},
+        ],
+    )
+    org1_id, org2_id, org3_id, org4_id, org5_id, org6_id = result.scalars().all()
+
+    await session.execute(
+        insert(PhoneNumber),
+        [
+            {"number": "555-123-4567", "organization_id": org1_id},
+            {"number": "555-234-5678", "organization_id": org1_id},
+            {"number": "555-345-6789", "organization_id": org2_id},
+            {"number": "555-456-7890", "organization_id": org3_id},
+            {"number": "555-567-8901", "organization_id": org3_id},
+            {"number": "555-678-9012", "organization_id": org4_id},
+            {"number": "555-789-0123", "organization_id": org5_id},
+            {"number": "555-890-1234", "organization_id": org6_id},
+            {"number": "555-901-2345", "organization_id": org6_id},
+        ],
+    )
 
-        session.add_all(
-            [
-                PhoneNumber(number="555-123-4567", organization_id=org1.id),
-                PhoneNumber(number="555-234-5678", organization_id=org1.id),
-                PhoneNumber(number="555-345-6789", organization_id=org2.id),
-                PhoneNumber(number="555-456-7890", organization_id=org3.id),
-                PhoneNumber(number="555-567-8901", organization_id=org3.id),
-                PhoneNumber(number="555-678-9012", organization_id=org4.id),
-                PhoneNumber(number="555-789-0123", organization_id=org5.id),
-                PhoneNumber(number="555-890-1234", organization_id=org6.id),
-                PhoneNumber(number="555-901-2345", organization_id=org6.id),
-            ]
-        )
-        await session.commit()
+    await session.execute(
+        insert(OrganizationActivity),
+        [
+            {"organization_id": org1_id, "activity_id": activities["food"]},
+            {"organization_id": org1_id, "activity_id": activities["meat"]},
+            {"organization_id": org1_id, "activity_id": activities["dairy"]},
+            {"organization_id": org2_id, "activity_id": activities["food"]},
+            {"organization_id": org2_id, "activity_id": activities["dairy"]},
+            {"organization_id": org3_id, "activity_id": activities["food"]},
+            {"organization_id": org3_id, "activity_id": activities["meat"]},
+            {"organization_id": org4_id, "activity_id": activities["cars"]},
+            {"organization_id": org4_id, "activity_id": activities["passenger_cars"]},
+            {"organization_id": org5_id, "activity_id": activities["cars"]},
+            {"organization_id": org5_id, "activity_id": activities["trucks"]},
+            {"organization_id": org6_id, "activity_id": activities["cars"]},
+            {"organization_id": org6_id, "activity_id": activities["passenger_cars"]},
+            {"organization_id": org6_id, "activity_id": activities["parts"]},
+        ],
+    )
 
-        session.add_all(
-            [
-                OrganizationActivity(
-                    organization_id=org1.id, activity_id=activities["food"].id
-                ),
-                OrganizationActivity(
-                    organization_id=org1.id, activity_id=activities["meat"].id
-                ),
-                OrganizationActivity(
-                    organization_id=org1.id, activity_id=activities["dairy"].id
-                ),
-                OrganizationActivity(
-                    organization_id=org2.id, activity_id=activities["food"].id
-                ),
-                OrganizationActivity(
-                    organization_id=org2.id, activity_id=activities["dairy"].id
-                ),
-                OrganizationActivity(
-                    organization_id=org3.id, activity_id=activities["food"].id
-                ),
-                OrganizationActivity(
-                    organization_id=org3.id, activity_id=activities["meat"].id
-                ),
-                OrganizationActivity(
-                    organization_id=org4.id, activity_id=activities["cars"].id
-                ),
-                OrganizationActivity(
-                    organization_id=org4.id, activity_id=activities["passenger_cars"].id
-                ),
-                OrganizationActivity(
-                    organization_id=org5.id, activity_id=activities["cars"].id
-                ),
-                OrganizationActivity(
-                    organization_id=org5.id, activity_id=activities["trucks"].id
-                ),
-                OrganizationActivity(
-                    organization_id=org6.id, activity_id=activities["cars"].id
-                ),
-                OrganizationActivity(
-                    organization_id=org6.id, activity_id=activities["passenger_cars"].id
-                ),
-                OrganizationActivity(
-                    organization_id=org6.id, activity_id=activities["parts"].id
-                ),
-            ]
-        )
+
+async def _create_in_own_session(create: Callable[[AsyncSession], Awaitable[T]]) -> T:
+    """Run a create step in its own session and commit it
+
+    Gives concurrent steps separate connections so asyncpg does not
+    serialize them on a single one.
+
+    Args:
+        create: Coroutine function taking a session
+
+    Returns:
+        Result of the create step
+
+    """
+    async with async_session() as session:
+        result = await create(session)
         await session.commit()
+        return result
 
 
 async def seed_db() -> None:
     """Main function to seed the database with test data"""
-    await create_organizations(
-        buildings=await create_buildings(), activities=await create_activities()
+    building_ids, activities = await asyncio.gather(
+        _create_in_own_session(create_buildings),
+        _create_in_own_session(create_activities),
     )
+    async with async_session() as session:
+        await create_organizations(
+            session=session, building_ids=building_ids, activities=activities
+        )
+        await session.commit()
     logging.info("Database seeded successfully")
 
 
@@ -1,9 +1,23 @@
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from api.dependencies import APIKeyMiddleware
 from api.routers import router
+from db.queries import refresh_activity_cache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    await refresh_activity_cache()
+    yield
+
+
+app = FastAPI(title="Nebus API", lifespan=lifespan)
 
-app = FastAPI(title="Nebus API")
+app.add_middleware(middleware_class=APIKeyMiddleware)
 
 app.add_middleware(
     middleware_class=CORSMiddleware,
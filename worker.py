@@ -0,0 +1,7 @@
+from uvicorn.workers import UvicornWorker as _UvicornWorker
+
+
+class UvicornWorker(_UvicornWorker):
+    """Uvicorn worker pinned to the uvloop event loop and httptools parser"""
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}